@@ -46,14 +46,18 @@ class CandleWidget(QOpenGLWidget):
         This should be called whenever the visible data changes (pan/zoom) or
         when style settings (like colors) that affect the GPU data are modified.
         """
-        visible_df = self.state.get_visible_data()
-        self.price_renderer.update_gl_buffers(visible_df, self.state)
-        self.volume_renderer.update_gl_buffers(visible_df, self.state)
+        self.price_renderer.update_gl_buffers(self.state)
+        self.volume_renderer.update_gl_buffers(self.state)
         self.update() # Schedules a repaint (paintGL call).
 
-    def set_data(self, dataframe: pd.DataFrame):
-        """Loads new candlestick data into the chart and resets the view."""
-        self.state.set_data(dataframe)
+    def set_data(self, dataframe: pd.DataFrame, arrays: dict | None = None):
+        """
+        Loads new candlestick data into the chart and resets the view.
+
+        `arrays` optionally carries the OHLCV columns already converted by
+        chart_state.ohlcv_arrays(), so the conversion can happen off the GUI thread.
+        """
+        self.state.set_data(dataframe, arrays)
         self._update_all_buffers()
 
     def set_mode(self, mode: ChartMode):
@@ -111,7 +115,7 @@ class CandleWidget(QOpenGLWidget):
 
         # Handle panning if active.
         if self.state.is_panning:
-            if self.state.df.empty: return
+            if self.state.total_bars == 0: return
             delta_x = self.state.mouse_pos.x() - self.state.pan_start_pos.x()
             # Convert pixel delta to bar index delta.
             bar_delta = delta_x / (self.width() / self.state.visible_bars)
@@ -130,13 +134,13 @@ class CandleWidget(QOpenGLWidget):
             return
 
         # Handle hovering.
-        if self.state.df.empty: return
+        if self.state.total_bars == 0: return
         # Calculate which bar index is under the mouse cursor.
         bar_width_px = self.width() / self.state.visible_bars
         idx_offset = int(self.state.mouse_pos.x() / bar_width_px)
         idx = self.state.start_bar + idx_offset
         
-        if idx >= len(self.state.df): idx = -1 # Cursor is off the right edge of data
+        if idx >= self.state.total_bars: idx = -1 # Cursor is off the right edge of data
         
         # If the hovered bar has changed, emit a signal.
         if idx != self.state.last_hovered_index:
@@ -149,7 +153,7 @@ class CandleWidget(QOpenGLWidget):
 
     def wheelEvent(self, event):
         """Handles mouse wheel events for zooming."""
-        if self.state.df.empty:
+        if self.state.total_bars == 0:
             super().wheelEvent(event); return
 
         # Determine zoom direction and factor.
@@ -162,7 +166,7 @@ class CandleWidget(QOpenGLWidget):
         
         # 2. Calculate the new number of visible bars.
         old_bars = self.state.visible_bars
-        new_bars = max(10, min(len(self.state.df), int(old_bars * zoom_factor)))
+        new_bars = max(10, min(self.state.total_bars, int(old_bars * zoom_factor)))
         if new_bars == old_bars: return # No change in zoom level
         
         self.state.visible_bars = new_bars
@@ -226,7 +230,7 @@ class CandleWidget(QOpenGLWidget):
         # correctly on top of the background and are not obscured by old data.
         glClear(GL_DEPTH_BUFFER_BIT)
 
-        if not self.state.df.empty:
+        if self.state.total_bars > 0:
             # Calculate pane dimensions for the renderers.
             or_consts = self.overlay_renderer
             chart_area_h = h - or_consts.time_axis_height
@@ -32,20 +32,23 @@ class PricePaneRenderer:
         self.wick_vert_count = 0
         self.body_vert_count = 0
 
-    def update_gl_buffers(self, visible_df: pd.DataFrame, state: ChartState):
+    def update_gl_buffers(self, state: ChartState):
         """
         Calculates and uploads candlestick geometry to the GPU.
 
-        This method processes the visible portion of the DataFrame, calculates
-        the vertex positions and colors for all wicks and bodies, and transfers
-        this data into the VBOs on the graphics card. This is the most
+        This method processes the visible slice of the state's OHLC arrays,
+        calculates the vertex positions and colors for all wicks and bodies, and
+        transfers this data into the VBOs on the graphics card. This is the most
         performance-critical part of the rendering pipeline.
 
         Args:
-            visible_df: DataFrame slice containing only the data for visible bars.
-            state: The current state of the chart, providing style information.
+            state: The current state of the chart, providing the data arrays,
+                   the visible range and style information.
         """
-        if visible_df.empty:
+        visible = state.visible_slice
+        o, h, l, c = state.o[visible], state.h[visible], state.l[visible], state.c[visible]
+        num_bars = len(o)
+        if num_bars == 0:
             self.wick_vert_count = 0
             self.body_vert_count = 0
             return
@@ -53,13 +56,11 @@ class PricePaneRenderer:
         # --- Data Preparation ---
         # A Doji candle (open == close) is drawn as a horizontal line, not a quad.
         # We separate them from normal candles for specialized processing.
-        doji_mask = visible_df['o'] == visible_df['c']
-        normal_candles_df = visible_df[~doji_mask]
-        doji_candles_df = visible_df[doji_mask]
+        doji_mask = o == c
+        normal_mask = ~doji_mask
 
-        is_up = (visible_df['c'] >= visible_df['o']).values
-        is_up_normal = (normal_candles_df['c'] >= normal_candles_df['o']).values
-        indices = np.arange(len(visible_df))
+        is_up = c >= o
+        indices = np.arange(num_bars)
 
         # --- 1. Prepare Wick & Doji Line Data ---
         # We combine all line-based geometry (vertical wicks and horizontal doji lines)
@@ -69,29 +70,28 @@ class PricePaneRenderer:
         
         # Generate vertical wick lines for all candles (Dojis included).
         # Each line requires two vertices (top and bottom).
-        vertical_wick_vertices = np.zeros((len(visible_df) * 2, 2), dtype=np.float32)
+        vertical_wick_vertices = np.zeros((num_bars * 2, 2), dtype=np.float32)
         vertical_wick_vertices[0::2, 0] = indices + 0.5  # X-coordinate (center of bar)
-        vertical_wick_vertices[0::2, 1] = visible_df['l'].values  # Y-coordinate (low price)
+        vertical_wick_vertices[0::2, 1] = l  # Y-coordinate (low price)
         vertical_wick_vertices[1::2, 0] = indices + 0.5  # X-coordinate (center of bar)
-        vertical_wick_vertices[1::2, 1] = visible_df['h'].values  # Y-coordinate (high price)
+        vertical_wick_vertices[1::2, 1] = h  # Y-coordinate (high price)
         wick_vertices_list.append(vertical_wick_vertices)
         
         # Define wick colors based on whether the candle is up or down.
-        up_wick_c = [state.up_wick_color.redF(), state.up_wick_color.greenF(), state.up_wick_color.blueF()]
-        down_wick_c = [state.down_wick_color.redF(), state.down_wick_color.greenF(), state.down_wick_color.blueF()]
-        all_wick_colors = np.array([up_wick_c if up else down_wick_c for up in is_up], dtype=np.float32)
+        up_wick_c = np.array([state.up_wick_color.redF(), state.up_wick_color.greenF(), state.up_wick_color.blueF()], dtype=np.float32)
+        down_wick_c = np.array([state.down_wick_color.redF(), state.down_wick_color.greenF(), state.down_wick_color.blueF()], dtype=np.float32)
+        all_wick_colors = np.where(is_up[:, None], up_wick_c, down_wick_c)
         wick_colors_list.append(np.repeat(all_wick_colors, 2, axis=0))
 
         # Generate horizontal lines for Doji candles if any exist.
-        if not doji_candles_df.empty:
+        if doji_mask.any():
             doji_indices = indices[doji_mask]
-            horizontal_doji_lines = np.zeros((len(doji_candles_df) * 2, 2), dtype=np.float32)
+            horizontal_doji_lines = np.zeros((len(doji_indices) * 2, 2), dtype=np.float32)
             # The x-coordinates define a horizontal line centered in the bar's space.
             horizontal_doji_lines[0::2, 0] = doji_indices + 0.1 # Left edge of the line
             horizontal_doji_lines[1::2, 0] = doji_indices + 0.9 # Right edge of the line
             # The y-coordinate is the open/close price.
-            doji_prices = doji_candles_df['o'].values
-            horizontal_doji_lines[:, 1] = np.repeat(doji_prices, 2)
+            horizontal_doji_lines[:, 1] = np.repeat(o[doji_mask], 2)
             wick_vertices_list.append(horizontal_doji_lines)
             
             # Use the same wick colors for the Doji lines.
@@ -106,18 +106,19 @@ class PricePaneRenderer:
         self.wick_vert_count = len(final_wick_vertices)
 
         # --- 2. Prepare Body Data (Non-Doji candles only) ---
-        if not normal_candles_df.empty:
-            normal_indices = indices[~doji_mask]
+        if normal_mask.any():
+            normal_indices = indices[normal_mask]
+            normal_o, normal_c = o[normal_mask], c[normal_mask]
             # Each body is a quad, requiring four vertices.
-            body_vertices = np.zeros((len(normal_candles_df) * 4, 2), dtype=np.float32)
-            body_vertices[0::4, 0] = normal_indices + 0.1; body_vertices[0::4, 1] = normal_candles_df['o'].values # Top-left
-            body_vertices[1::4, 0] = normal_indices + 0.9; body_vertices[1::4, 1] = normal_candles_df['o'].values # Top-right
-            body_vertices[2::4, 0] = normal_indices + 0.9; body_vertices[2::4, 1] = normal_candles_df['c'].values # Bottom-right
-            body_vertices[3::4, 0] = normal_indices + 0.1; body_vertices[3::4, 1] = normal_candles_df['c'].values # Bottom-left
+            body_vertices = np.zeros((len(normal_indices) * 4, 2), dtype=np.float32)
+            body_vertices[0::4, 0] = normal_indices + 0.1; body_vertices[0::4, 1] = normal_o # Top-left
+            body_vertices[1::4, 0] = normal_indices + 0.9; body_vertices[1::4, 1] = normal_o # Top-right
+            body_vertices[2::4, 0] = normal_indices + 0.9; body_vertices[2::4, 1] = normal_c # Bottom-right
+            body_vertices[3::4, 0] = normal_indices + 0.1; body_vertices[3::4, 1] = normal_c # Bottom-left
 
-            up_body_c = [state.up_color.redF(), state.up_color.greenF(), state.up_color.blueF()]
-            down_body_c = [state.down_color.redF(), state.down_color.greenF(), state.down_color.blueF()]
-            body_colors_np = np.array([up_body_c if up else down_body_c for up in is_up_normal], dtype=np.float32)
+            up_body_c = np.array([state.up_color.redF(), state.up_color.greenF(), state.up_color.blueF()], dtype=np.float32)
+            down_body_c = np.array([state.down_color.redF(), state.down_color.greenF(), state.down_color.blueF()], dtype=np.float32)
+            body_colors_np = np.where(is_up[normal_mask][:, None], up_body_c, down_body_c)
 
             self.body_vbo.set_array(body_vertices)
             self.body_color_vbo.set_array(np.repeat(body_colors_np, 4, axis=0))
@@ -137,7 +138,7 @@ class PricePaneRenderer:
         """
         if self.wick_vert_count == 0 and self.body_vert_count == 0: return
             
-        min_price, display_range = state.get_price_range(state.get_visible_data())
+        min_price, display_range = state.get_price_range()
         max_price = min_price + display_range
 
         # Configure OpenGL for this specific pane:
@@ -182,28 +183,31 @@ class VolumePaneRenderer:
         self.volume_color_vbo = vbo.VBO(np.array([], dtype=np.float32))
         self.volume_vert_count = 0
 
-    def update_gl_buffers(self, visible_df: pd.DataFrame, state: ChartState):
+    def update_gl_buffers(self, state: ChartState):
         """Calculates and uploads volume bar geometry to the GPU."""
-        if visible_df.empty: 
+        visible = state.visible_slice
+        volumes = state.v[visible]
+        num_bars = len(volumes)
+        if num_bars == 0: 
             self.volume_vert_count = 0
             return
             
-        indices = np.arange(len(visible_df))
+        indices = np.arange(num_bars)
         # Each volume bar is a quad defined by 4 vertices.
-        volume_vertices = np.zeros((len(visible_df) * 4, 2), dtype=np.float32)
+        volume_vertices = np.zeros((num_bars * 4, 2), dtype=np.float32)
         # The bottom y-coordinate is always 0. The top y-coordinate is the volume.
         volume_vertices[0::4, 0] = indices + 0.1; volume_vertices[0::4, 1] = 0 # Bottom-left
         volume_vertices[1::4, 0] = indices + 0.9; volume_vertices[1::4, 1] = 0 # Bottom-right
-        volume_vertices[2::4, 0] = indices + 0.9; volume_vertices[2::4, 1] = visible_df['v'].values # Top-right
-        volume_vertices[3::4, 0] = indices + 0.1; volume_vertices[3::4, 1] = visible_df['v'].values # Top-left
+        volume_vertices[2::4, 0] = indices + 0.9; volume_vertices[2::4, 1] = volumes # Top-right
+        volume_vertices[3::4, 0] = indices + 0.1; volume_vertices[3::4, 1] = volumes # Top-left
         
         # Determine colors based on the corresponding price candle's direction.
-        is_up = (visible_df['c'] >= visible_df['o']).values
+        is_up = state.c[visible] >= state.o[visible]
         up_c = state.up_volume_color; down_c = state.down_volume_color
         # Note: Volume colors include an alpha component for semi-transparency.
-        up_color = [up_c.redF(), up_c.greenF(), up_c.blueF(), up_c.alphaF()]
-        down_color = [down_c.redF(), down_c.greenF(), down_c.blueF(), down_c.alphaF()]
-        colors_np = np.array([up_color if up else down_color for up in is_up], dtype=np.float32)
+        up_color = np.array([up_c.redF(), up_c.greenF(), up_c.blueF(), up_c.alphaF()], dtype=np.float32)
+        down_color = np.array([down_c.redF(), down_c.greenF(), down_c.blueF(), down_c.alphaF()], dtype=np.float32)
+        colors_np = np.where(is_up[:, None], up_color, down_color)
         
         self.volume_vbo.set_array(volume_vertices)
         self.volume_color_vbo.set_array(np.repeat(colors_np, 4, axis=0))
@@ -214,7 +218,8 @@ class VolumePaneRenderer:
         if self.volume_vert_count == 0: return
 
         # Find the max volume in the visible range to scale the y-axis.
-        max_volume = state.get_visible_data()['v'].max() if not state.get_visible_data().empty else 1
+        extents = state.get_visible_extents()
+        max_volume = extents[2] if extents is not None else 1
         
         # Set up the OpenGL projection for the volume pane.
         glEnable(GL_SCISSOR_TEST); glScissor(0, y_offset, w, pane_h)
@@ -291,7 +296,7 @@ class OverlayRenderer:
         price_pane_h = chart_area_h - volume_pane_h - self.pane_separator_height
         price_pane_top_y = 0
         
-        min_display_price, price_range = state.get_price_range(visible_df)
+        min_display_price, price_range = state.get_price_range()
 
         # Draw UI components.
         self._draw_price_axis(painter, state, w, price_pane_h, price_pane_top_y, min_display_price, price_range)
@@ -378,15 +383,15 @@ class OverlayRenderer:
         painter.restore()
 
         # 2. Convert pixel coordinates to data indices
-        if state.df.empty or state.visible_bars == 0:
+        if state.total_bars == 0 or state.visible_bars == 0:
             return
 
         bar_width_px = w / state.visible_bars
         start_idx = state.start_bar + int(selection_rect.left() / bar_width_px)
         end_idx = state.start_bar + int(selection_rect.right() / bar_width_px)
         
-        start_idx = max(0, min(start_idx, len(state.df) - 1))
-        end_idx = max(0, min(end_idx, len(state.df) - 1))
+        start_idx = max(0, min(start_idx, state.total_bars - 1))
+        end_idx = max(0, min(end_idx, state.total_bars - 1))
 
         if start_idx > end_idx:
             start_idx, end_idx = end_idx, start_idx
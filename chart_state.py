@@ -1,8 +1,30 @@
+import numpy as np
 import pandas as pd
-from PyQt6.QtGui import QColor
 from PyQt6.QtCore import QPoint
 from chart_enums import ChartMode
-from style_manager import StyleManager, PEN_STYLE_MAP
+from style_manager import PEN_STYLE_MAP, color_from_hex
+import style_manager
+
+OHLCV_COLUMNS = ('o', 'h', 'l', 'c', 'v')
+
+def ohlcv_arrays(dataframe: pd.DataFrame) -> dict[str, np.ndarray]:
+    """
+    Converts the OHLCV columns of a DataFrame to contiguous float32 arrays.
+
+    The vertex buffers are float32 anyway, so this is the precision the GPU
+    sees; the DataFrame itself keeps the source precision for the numeric
+    readouts. This is safe to call off the GUI thread, which lets the data
+    loader do the conversion before handing the data over.
+
+    Args:
+        dataframe: A DataFrame containing the 'o', 'h', 'l', 'c', 'v' columns.
+
+    Returns:
+        A dict mapping each column name to its float32 array.
+    """
+    if dataframe.empty:
+        return {col: np.empty(0, dtype=np.float32) for col in OHLCV_COLUMNS}
+    return {col: np.ascontiguousarray(dataframe[col].to_numpy(), dtype=np.float32) for col in OHLCV_COLUMNS}
 
 class ChartState:
     """
@@ -19,6 +41,12 @@ class ChartState:
     def __init__(self, dataframe: pd.DataFrame = None):
         # --- Core Data ---
         self.df: pd.DataFrame = dataframe if dataframe is not None else pd.DataFrame()
+        # Cached len(self.df), kept in sync by set_data().
+        self.total_bars: int = len(self.df)
+        # The OHLCV columns as contiguous NumPy arrays (a structure of arrays),
+        # so renderers can slice and reduce them without going through pandas.
+        # Populated as self.o, self.h, self.l, self.c and self.v.
+        self._extract_arrays()
 
         # --- Viewport State ---
         # The index of the first bar visible on the left side of the chart.
@@ -56,44 +84,88 @@ class ChartState:
         It populates the state object with ready-to-use QColor and Qt.PenStyle
         objects.
         """
-        sm = StyleManager()
+        sm = style_manager.INSTANCE
         # --- Colors ---
-        self.up_color = QColor(sm.get_value("colors/up_candle"))
-        # FIX: Corrected the typo from get_v_value to get_value.
-        self.down_color = QColor(sm.get_value("colors/down_candle"))
-        self.up_wick_color = QColor(sm.get_value("colors/up_wick"))
-        self.down_wick_color = QColor(sm.get_value("colors/down_wick"))
-        self.up_volume_color = QColor(sm.get_value("colors/up_volume"))
-        self.down_volume_color = QColor(sm.get_value("colors/down_volume"))
-        self.crosshair_color = QColor(sm.get_value("lines/crosshair"))
-        self.price_grid_color = QColor(sm.get_value("lines/price_grid"))
-        self.time_grid_color = QColor(sm.get_value("lines/time_grid"))
+        self.up_color = color_from_hex(sm.get("colors/up_candle"))
+        self.down_color = color_from_hex(sm.get("colors/down_candle"))
+        self.up_wick_color = color_from_hex(sm.get("colors/up_wick"))
+        self.down_wick_color = color_from_hex(sm.get("colors/down_wick"))
+        self.up_volume_color = color_from_hex(sm.get("colors/up_volume"))
+        self.down_volume_color = color_from_hex(sm.get("colors/down_volume"))
+        self.crosshair_color = color_from_hex(sm.get("lines/crosshair"))
+        self.price_grid_color = color_from_hex(sm.get("lines/price_grid"))
+        self.time_grid_color = color_from_hex(sm.get("lines/time_grid"))
         
         # --- Line Properties ---
-        self.crosshair_width = int(sm.get_value("props/crosshair_width"))
-        self.crosshair_style = PEN_STYLE_MAP[sm.get_value("props/crosshair_style")]
-        self.price_grid_width = int(sm.get_value("props/price_grid_width"))
-        self.price_grid_style = PEN_STYLE_MAP[sm.get_value("props/price_grid_style")]
-        self.time_grid_width = int(sm.get_value("props/time_grid_width"))
-        self.time_grid_style = PEN_STYLE_MAP[sm.get_value("props/time_grid_style")]
+        self.crosshair_width = int(sm.get("props/crosshair_width"))
+        self.crosshair_style = PEN_STYLE_MAP[sm.get("props/crosshair_style")]
+        self.price_grid_width = int(sm.get("props/price_grid_width"))
+        self.price_grid_style = PEN_STYLE_MAP[sm.get("props/price_grid_style")]
+        self.time_grid_width = int(sm.get("props/time_grid_width"))
+        self.time_grid_style = PEN_STYLE_MAP[sm.get("props/time_grid_style")]
         
         # --- Background ---
-        self.bg_mode = sm.get_value("background/mode")
-        self.bg_color1 = QColor(sm.get_value("background/color1"))
-        self.bg_color2 = QColor(sm.get_value("background/color2"))
-        self.bg_gradient_dir = sm.get_value("background/gradient_direction")
+        self.bg_mode = sm.get("background/mode")
+        self.bg_color1 = color_from_hex(sm.get("background/color1"))
+        self.bg_color2 = color_from_hex(sm.get("background/color2"))
+        self.bg_gradient_dir = sm.get("background/gradient_direction")
 
         # --- Other ---
-        self.volume_pane_ratio = float(sm.get_value("other/volume_pane_ratio"))
+        self.volume_pane_ratio = float(sm.get("other/volume_pane_ratio"))
+
+    def set_data(self, dataframe: pd.DataFrame, arrays: dict[str, np.ndarray] | None = None):
+        """
+        Resets the chart's state with a new DataFrame.
 
-    def set_data(self, dataframe: pd.DataFrame):
-        """Resets the chart's state with a new DataFrame."""
+        Args:
+            dataframe: The new OHLCV data.
+            arrays: The columns already converted by ohlcv_arrays(), if the
+                    caller has them; otherwise they are extracted here.
+        """
         self.df = dataframe
+        self.total_bars = len(dataframe)
+        self._extract_arrays(arrays)
         # Reset view to the beginning of the new data.
         self.start_bar = 0
         self.visible_bars = 100
         self.zoom_factor = 1.0
         
+    def _extract_arrays(self, arrays: dict[str, np.ndarray] | None = None):
+        """Caches each OHLCV column of the DataFrame as a contiguous float32 array."""
+        # Any cached extents refer to the previous data.
+        self._extents_key = None
+        self._extents = None
+        if arrays is None:
+            arrays = ohlcv_arrays(self.df)
+        self.o, self.h, self.l, self.c, self.v = (arrays[col] for col in OHLCV_COLUMNS)
+
+    @property
+    def visible_slice(self) -> slice:
+        """The slice of bar indices currently visible, for indexing the OHLCV arrays."""
+        return slice(self.start_bar, self.start_bar + self.visible_bars)
+
+    def get_visible_extents(self) -> tuple[float, float, float] | None:
+        """
+        Returns (lowest_low, highest_high, max_volume) over the visible bars.
+
+        The reductions are computed once per view (start_bar, visible_bars) and
+        cached, since every repaint (e.g. each crosshair move) needs them but
+        they only change when the chart is panned, zoomed or given new data.
+
+        Returns:
+            The extents tuple, or None if no bars are visible.
+        """
+        key = (self.start_bar, self.visible_bars)
+        if key != self._extents_key:
+            visible = self.visible_slice
+            lows = self.l[visible]
+            if lows.size == 0:
+                self._extents = None
+            else:
+                self._extents = (float(lows.min()), float(self.h[visible].max()), float(self.v[visible].max()))
+            self._extents_key = key
+        return self._extents
+
     def get_visible_data(self) -> pd.DataFrame:
         """Returns a slice of the DataFrame corresponding to the visible bars."""
         if self.df.empty:
@@ -104,10 +176,8 @@ class ChartState:
     @property
     def max_start_bar(self) -> int:
         """Calculates the maximum valid value for start_bar."""
-        if self.df.empty:
-            return 0
         # This prevents panning too far to the right, leaving empty space.
-        return max(0, len(self.df) - self.visible_bars)
+        return max(0, self.total_bars - self.visible_bars)
 
     def update_start_bar(self, new_start_bar: int):
         """
@@ -119,21 +189,20 @@ class ChartState:
         # Clamp the value between 0 and the maximum allowed start bar.
         self.start_bar = max(0, min(new_start_bar, self.max_start_bar))
 
-    def get_price_range(self, df_slice: pd.DataFrame) -> tuple[float, float]:
+    def get_price_range(self) -> tuple[float, float]:
         """
         Calculates the minimum price and price range for the Y-axis of the price pane.
         
-        Args:
-            df_slice: The DataFrame containing only the visible data.
+        The range is based on the cached extents of the visible bars.
 
         Returns:
             A tuple containing (minimum_display_price, total_display_range).
         """
-        if df_slice.empty:
+        extents = self.get_visible_extents()
+        if extents is None:
             return 0, 1 # Default range if no data
             
-        min_p = df_slice['l'].min()
-        max_p = df_slice['h'].max()
+        min_p, max_p, _ = extents
         
         # Calculate the actual range of data and add padding.
         center = (min_p + max_p) / 2
@@ -1,11 +1,27 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
-def load_parquet_data(file_path: str) -> pd.DataFrame:
+# The columns the chart needs. Anything else in the file is never read.
+REQUIRED_COLUMNS = ['t', 'o', 'h', 'l', 'c', 'v']
+
+# Files larger than this (in bytes) are decoded in a separate process, so the
+# pandas conversion never competes with the UI thread for the GIL.
+LARGE_FILE_THRESHOLD = 50_000_000
+
+# The process pool used for large files, created on first use.
+_executor = None
+
+def load_parquet_data(file_path: str, progress_callback=None, total_rows_callback=None) -> pd.DataFrame:
     """
     Loads OHLCV data from a specified Parquet file.
 
     This function performs several crucial preprocessing steps:
-    1. Ensures all required columns ('t', 'o', 'h', 'l', 'c', 'v') are present.
+    1. Ensures all required columns ('t', 'o', 'h', 'l', 'c', 'v') are present,
+       and reads only those columns from disk.
     2. Removes any rows with missing data in essential columns to prevent errors.
     3. Standardizes the timestamp column to be timezone-aware (UTC).
     4. Resets the DataFrame index to be a continuous integer sequence (0, 1, 2,...),
@@ -13,21 +29,47 @@ def load_parquet_data(file_path: str) -> pd.DataFrame:
 
     Args:
         file_path: The full path to the .parquet file.
+        progress_callback: Optional callable, called with the cumulative number
+                           of rows read after each record batch is decoded.
+        total_rows_callback: Optional callable, called once with the number of
+                             rows in the file (from its footer) before decoding.
 
     Returns:
         A cleaned and prepared pandas DataFrame, or an empty DataFrame on error.
     """
     print(f"Loading data from: {file_path}")
     try:
-        df = pd.read_parquet(file_path)
-        
         # --- 1. Validate Columns ---
-        required_cols = ['t', 'o', 'h', 'l', 'c', 'v']
-        if not all(col in df.columns for col in required_cols):
+        # Opening the file only reads its footer, which holds both the schema
+        # and the row count, so this check is cheap. pre_buffer coalesces the
+        # per-column chunk reads below into fewer, larger I/O requests, which
+        # matters most on slow or high-latency filesystems.
+        parquet_file = pq.ParquetFile(file_path, pre_buffer=True)
+        file_schema = parquet_file.schema_arrow
+        if not all(col in file_schema.names for col in REQUIRED_COLUMNS):
             # If data is missing essential columns, it cannot be plotted.
-            print(f"Error: Input data must contain the following columns: {required_cols}")
+            print(f"Error: Input data must contain the following columns: {REQUIRED_COLUMNS}")
             return pd.DataFrame()
 
+        if total_rows_callback is not None:
+            total_rows_callback(parquet_file.metadata.num_rows)
+        # Read just the required columns, batch by batch so that progress can
+        # be reported.
+        batches = []
+        rows_read = 0
+        for batch in parquet_file.iter_batches(columns=REQUIRED_COLUMNS):
+            batches.append(batch)
+            rows_read += batch.num_rows
+            if progress_callback is not None:
+                progress_callback(rows_read)
+        schema = pa.schema([file_schema.field(col) for col in REQUIRED_COLUMNS])
+        table = pa.Table.from_batches(batches, schema=schema)
+        del batches
+        # self_destruct frees each Arrow column as soon as pandas owns a copy,
+        # so the file is never held in memory twice.
+        df = table.to_pandas(self_destruct=True, split_blocks=True)
+        del table
+
         initial_rows = len(df)
         print(f"Original data points: {initial_rows}")
 
@@ -57,4 +99,60 @@ def load_parquet_data(file_path: str) -> pd.DataFrame:
 
     except Exception as e:
         print(f"An unexpected error occurred during data loading or processing: {e}")
-        return pd.DataFrame()
\ No newline at end of file
+        return pd.DataFrame()
+
+def _get_executor() -> ProcessPoolExecutor:
+    """Returns the shared single-worker process pool, creating it on first use."""
+    global _executor
+    if _executor is None:
+        # The caller is a thread of a running Qt process, which must not be
+        # fork()ed, so the worker is started as a fresh interpreter instead.
+        _executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+    return _executor
+
+def shutdown_executor():
+    """Shuts down the worker process pool, if one was started. Call on application exit."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+def _load_as_arrow_ipc(file_path: str) -> bytes:
+    """
+    Loads a Parquet file and serializes the result as an Arrow IPC stream.
+
+    This runs inside the worker process. Arrow IPC is a flat columnar buffer,
+    so it is far cheaper to send back to the parent than a pickled DataFrame.
+    """
+    df = load_parquet_data(file_path)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+def load_parquet_data_in_subprocess(file_path: str) -> pd.DataFrame:
+    """
+    Loads OHLCV data exactly like `load_parquet_data`, but in a worker process.
+
+    Intended for large files, where decoding and cleaning the data would
+    otherwise hold the GIL for long stretches. This call blocks until the
+    data is ready, so it should itself be run off the UI thread.
+
+    Args:
+        file_path: The full path to the .parquet file.
+
+    Returns:
+        A cleaned and prepared pandas DataFrame, or an empty DataFrame on error.
+    """
+    global _executor
+    future = _get_executor().submit(_load_as_arrow_ipc, file_path)
+    try:
+        ipc_bytes = future.result()
+    except BrokenProcessPool:
+        # The worker died (e.g. killed for running out of memory). Drop the
+        # unusable pool so the next load starts a new one.
+        _executor = None
+        raise
+    table = pa.ipc.open_stream(ipc_bytes).read_all()
+    return table.to_pandas(use_threads=True)
@@ -16,7 +16,13 @@ class InfoWidget(QLabel):
         self.setWindowFlags(
             Qt.WindowType.ToolTip | Qt.WindowType.FramelessWindowHint
         )
-        self.hide()
+        super().hide()
+
+    def hide(self):
+        """Hides the widget, returning early if it is already hidden."""
+        # mouseLeftChart fires at interactive rates, mostly while already hidden.
+        if self.isVisible():
+            super().hide()
 
     def update_and_show(self, data_row: pd.Series, pos: QPoint):
         """
@@ -1,45 +1,116 @@
+import os
 import sys
+import logging
 from pathlib import Path
-from datetime import datetime
+from functools import lru_cache
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QFileDialog, QWidget, 
                              QSizePolicy, QVBoxLayout, QScrollBar, QMessageBox, 
-                             QStatusBar)
-from PyQt6.QtGui import QAction, QIcon, QActionGroup
-from PyQt6.QtCore import Qt, QSettings, QPoint, QObject, QThread, pyqtSignal
+                             QStatusBar, QProgressBar, QStackedWidget)
+from PyQt6.QtGui import QAction, QIcon, QActionGroup, QPixmap, QPixmapCache
+from PyQt6.QtCore import Qt, QSettings, QPoint, QObject, QThread, QTimer, pyqtSignal, pyqtSlot
 import pandas as pd
 import re
 
 # Application-specific modules
-from data_loader import load_parquet_data
+from data_loader import (load_parquet_data, load_parquet_data_in_subprocess, shutdown_executor,
+                         LARGE_FILE_THRESHOLD)
 from candle_widget import CandleWidget
+from chart_state import ohlcv_arrays
 from preferences_dialog import PreferencesDialog
 from welcome_widget import WelcomeWidget
 from info_widget import InfoWidget
 from chart_enums import ChartMode
 
+logger = logging.getLogger(__name__)
+
+# Splits a timeframe string such as "15min" into its number and unit parts.
+_TF_RE = re.compile(r"(\d+)([a-zA-Z]+)")
+# Maps the common timeframe unit suffixes to their full names.
+_UNIT_MAP = {'s': 'Second', 'sec': 'Second', 'min': 'Minute', 'h': 'Hour', 'hr': 'Hour',
+             'd': 'Day', 'w': 'Week', 'wk': 'Week', 'm': 'Month', 'mo': 'Month', 'month': 'Month'}
+# Fallback for other suffixes, keyed on their first letter. "m" is ambiguous
+# (minute vs. month) and is resolved separately in format_timeframe.
+_UNIT_BY_LETTER = {'s': 'Second', 'h': 'Hour', 'd': 'Day', 'w': 'Week'}
+# Matches data file stems named like TICKER_TIMEFRAME_OHLCV_YEAR_MONTH[_...].
+_STEM_RE = re.compile(r"^([^_]+)_([^_]+)_[^_]+_(\d{4})_(0?[1-9]|1[0-2])(?:_|$)")
+# Month names indexed by month number (1-12); index 0 is unused.
+_MONTH_NAMES = ('', 'January', 'February', 'March', 'April', 'May', 'June', 'July',
+                'August', 'September', 'October', 'November', 'December')
+
+# Image files used for the window and toolbar icons, preloaded at startup.
+_ICON_FILES = ('icons/appicon.png', 'icons/load_data.png', 'icons/save_labels.png',
+               'icons/cursor.png', 'icons/marker.png')
+
+def _cached_pixmap(path: str) -> QPixmap:
+    """Returns the pixmap for an image file, decoding it only on a QPixmapCache miss."""
+    # Qt aborts the whole process if a pixmap is created before the application
+    # object, so fail with a normal exception instead.
+    if QApplication.instance() is None:
+        raise RuntimeError("Icons cannot be loaded before the QApplication is created.")
+    pixmap = QPixmapCache.find(path)
+    if pixmap is None:
+        pixmap = QPixmap(path)
+        QPixmapCache.insert(path, pixmap)
+    return pixmap
+
+@lru_cache(maxsize=None)
+def _file_icon(path: str) -> QIcon:
+    """Returns a shared QIcon built from an image file's cached pixmap."""
+    return QIcon(_cached_pixmap(path))
+
+@lru_cache(maxsize=None)
+def _theme_icon(name: str) -> QIcon:
+    """Returns a shared QIcon from the system icon theme, looking it up only once."""
+    return QIcon.fromTheme(name)
+
 class DataLoaderWorker(QObject):
     """
     Performs data loading in a separate thread to prevent freezing the UI.
 
-    This worker is moved to a QThread to handle potentially slow file I/O
-    and data processing without blocking the main application event loop.
-    It communicates results back to the main thread via signals.
+    This worker is moved to a long-lived QThread to handle potentially slow
+    file I/O and data processing without blocking the main application event
+    loop. Loads are requested by emitting `load_requested`, and results are
+    communicated back to the main thread via signals.
 
     Signals:
-        finished: Emitted on successful data load, carrying the filepath and DataFrame.
+        load_requested: Emitted (from the main thread) to load the given file path.
+        progress_started: Emitted before decoding starts, carrying the total number
+                          of rows to read (0 if progress will not be reported).
+        progress: Emitted as data is decoded, carrying the number of rows read so far.
+        finished: Emitted on successful data load, carrying the filepath, the DataFrame
+                  and its OHLCV columns as float32 arrays (see ohlcv_arrays).
         error: Emitted when an error occurs during loading.
     """
-    finished = pyqtSignal(str, pd.DataFrame)
+    load_requested = pyqtSignal(str)
+    progress_started = pyqtSignal(int)
+    progress = pyqtSignal(int)
+    # The arrays are declared as `object`: a `dict` argument would be converted
+    # to and from a QVariantMap on every emit.
+    finished = pyqtSignal(str, pd.DataFrame, object)
     error = pyqtSignal(str)
 
+    def __init__(self):
+        super().__init__()
+        self.load_requested.connect(self.run)
+
+    @pyqtSlot(str)
     def run(self, file_path: str):
         """Loads and processes data from the given file path."""
         try:
-            df = load_parquet_data(file_path)
+            # Large files are decoded in a separate process to keep the GIL free
+            # for the UI thread. That path cannot report incremental progress.
+            if os.path.getsize(file_path) > LARGE_FILE_THRESHOLD:
+                self.progress_started.emit(0)
+                df = load_parquet_data_in_subprocess(file_path)
+            else:
+                # The loader reports the row count from the file footer before decoding.
+                df = load_parquet_data(file_path, progress_callback=self.progress.emit,
+                                       total_rows_callback=self.progress_started.emit)
             if df.empty:
                 self.error.emit(f"No data was loaded from {file_path}. The file might be empty or contain invalid data.")
             else:
-                self.finished.emit(file_path, df)
+                # Convert to float32 arrays here rather than on the GUI thread.
+                self.finished.emit(file_path, df, ohlcv_arrays(df))
         except Exception as e:
             # Catch any unexpected errors during the loading process.
             self.error.emit(f"An unexpected error occurred while loading the data:\n{e}")
@@ -59,46 +130,67 @@ class MainWindow(QMainWindow):
         
         # Use QSettings to remember window size and position between sessions.
         self.settings = QSettings()
-        geom = self.settings.value("geometry")
+        # Settings writes are batched and flushed together after a short delay
+        # (or on close), so interactive code paths never wait on a disk sync.
+        self._pending_settings = {}
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(500)
+        self._settings_timer.timeout.connect(self._flush_settings)
+        # Hover updates are coalesced to at most one per frame (~16 ms); only
+        # the most recent (data_row, mouse_pos) is applied to the info widget.
+        self._pending_hover = None
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(16)
+        self._hover_timer.timeout.connect(self._flush_hover)
+        # Where bar hovers are routed for the current mode (see _set_chart_mode);
+        # the app starts in cursor mode.
+        self._hover_sink = self._queue_hover
+        # The stored geometry is kept so closeEvent can compare against it
+        # without going back to QSettings.
+        self._initial_geom_bytes = geom = self.settings.value("geometry")
         if geom: self.restoreGeometry(geom)
         else: self.setGeometry(100, 100, 1200, 800)
 
-        # A reference to the preferences dialog to ensure it's not garbage-collected.
-        self.prefs_dialog = None
-
         # --- Central Widget Management ---
-        # The app starts with a welcome screen.
+        # The welcome screen and the chart container share a stacked widget, which
+        # stays the central widget; loading data just switches the visible page.
+        self.stack = QStackedWidget()
         self.welcome_screen = WelcomeWidget()
-        # The chart widget and its scrollbar are held in a container.
-        self.chart_widget = CandleWidget()
-        self.scrollbar = QScrollBar(Qt.Orientation.Horizontal)
-        self.chart_container = QWidget()
-        chart_layout = QVBoxLayout(self.chart_container)
-        chart_layout.setContentsMargins(0, 0, 0, 0)
-        chart_layout.setSpacing(0)
-        chart_layout.addWidget(self.chart_widget)
-        chart_layout.addWidget(self.scrollbar)
-        
-        # Initially, show the welcome screen. It will be replaced by the chart
-        # container once data is loaded.
-        self.setCentralWidget(self.welcome_screen)
+        self.stack.addWidget(self.welcome_screen)
+        # The chart widget and its scrollbar are held in a container, which is
+        # only built and added to the stack once the first file has loaded
+        # (see _ensure_chart_container).
+        self.chart_container = None
+        self.chart_widget = None
+        self.scrollbar = None
+        self.setCentralWidget(self.stack)
         
         # --- UI Components ---
         self.setStatusBar(QStatusBar(self))
-        self.info_widget = InfoWidget(self) # Floating OHLCV info panel
+        # Shows load progress in the status bar; hidden while idle.
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setMaximumWidth(200)
+        self.progress_bar.hide()
+        self.statusBar().addPermanentWidget(self.progress_bar)
+        # The floating OHLCV info panel is only created on first hover.
+        self._info_widget = None
         self.setup_toolbar()
 
-        # --- Signal/Slot Connections ---
-        self.chart_widget.barHovered.connect(self.handle_bar_hover)
-        self.chart_widget.mouseLeftChart.connect(self.info_widget.hide)
-        self.chart_widget.viewChanged.connect(self.on_chart_view_changed)
-        self.scrollbar.valueChanged.connect(self.on_scrollbar_moved)
-        
+        # The preferences dialog is created once and reused; it is only ever
+        # hidden, never destroyed, so reopening it is cheap.
+        self.prefs_dialog = PreferencesDialog(self)
+        self.prefs_dialog.settings_applied.connect(self.on_settings_applied)
+
         # --- State Management ---
         # Disable actions that require data to be loaded.
         self.update_action_states(is_data_loaded=False)
-        self.thread = None
-        self.worker = None
+        self._setup_io_thread()
+        # The last (total_bars, visible_bars, start_bar) synced to the scrollbar.
+        self._last_view = (-1, -1, -1)
+        # True while on_chart_view_changed is updating the scrollbar.
+        self._syncing_scrollbar = False
 
     def setup_toolbar(self):
         """Creates and configures the main application toolbar."""
@@ -106,23 +198,23 @@ class MainWindow(QMainWindow):
         toolbar.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonIconOnly)
         
         # --- File Actions ---
-        self.load_action = QAction(QIcon('icons/load_data.png'), 'Load Data', self)
+        self.load_action = QAction(_file_icon('icons/load_data.png'), 'Load Data', self)
         self.load_action.setToolTip("Load Parquet Data File (*.parquet)")
         self.load_action.triggered.connect(self.open_file)
         toolbar.addAction(self.load_action)
         
-        self.save_action = QAction(QIcon('icons/save_labels.png'), 'Save Labels', self)
+        self.save_action = QAction(_file_icon('icons/save_labels.png'), 'Save Labels', self)
         self.save_action.setToolTip("Save Labels (Not Implemented)")
         toolbar.addAction(self.save_action)
         
         toolbar.addSeparator()
 
         # --- Functionality Actions ---
-        self.prepopulate_action = QAction(QIcon.fromTheme('media-playback-start'), 'Pre-populate', self)
+        self.prepopulate_action = QAction(_theme_icon('media-playback-start'), 'Pre-populate', self)
         self.prepopulate_action.setToolTip("Pre-populate (Not Implemented)")
         toolbar.addAction(self.prepopulate_action)
         
-        self.train_action = QAction(QIcon.fromTheme('system-run'), 'Train Model', self)
+        self.train_action = QAction(_theme_icon('system-run'), 'Train Model', self)
         self.train_action.setToolTip("Train Model (Not Implemented)")
         toolbar.addAction(self.train_action)
         
@@ -133,30 +225,70 @@ class MainWindow(QMainWindow):
         mode_group = QActionGroup(self)
         mode_group.setExclusive(True) # Ensures only one mode can be active.
         
-        self.cursor_mode_action = QAction(QIcon('icons/cursor.png'), 'Cursor', self)
+        self.cursor_mode_action = QAction(_file_icon('icons/cursor.png'), 'Cursor', self)
         self.cursor_mode_action.setCheckable(True); self.cursor_mode_action.setChecked(True)
-        self.cursor_mode_action.setData(ChartMode.CURSOR)
         self.cursor_mode_action.setToolTip("Activate Cursor Mode (for inspecting candles)")
         toolbar.addAction(self.cursor_mode_action); mode_group.addAction(self.cursor_mode_action)
         
-        self.marker_mode_action = QAction(QIcon('icons/marker.png'), 'Marker', self)
+        self.marker_mode_action = QAction(_file_icon('icons/marker.png'), 'Marker', self)
         self.marker_mode_action.setCheckable(True)
-        self.marker_mode_action.setData(ChartMode.MARKER)
         self.marker_mode_action.setToolTip("Activate Marker Mode (for labelling)")
         toolbar.addAction(self.marker_mode_action); mode_group.addAction(self.marker_mode_action)
         
-        mode_group.triggered.connect(self.on_mode_change)
+        # Each action maps to a fixed mode, so connect it straight to that mode.
+        self.cursor_mode_action.triggered.connect(lambda: self._set_chart_mode(ChartMode.CURSOR))
+        self.marker_mode_action.triggered.connect(lambda: self._set_chart_mode(ChartMode.MARKER))
         toolbar.addSeparator()
         
         # --- Preferences Action ---
-        self.prefs_action = QAction(QIcon.fromTheme('preferences-system'), 'Preferences', self)
+        self.prefs_action = QAction(_theme_icon('preferences-system'), 'Preferences', self)
         self.prefs_action.setToolTip("Open Appearance Preferences")
         self.prefs_action.triggered.connect(self.open_preferences_dialog)
         toolbar.addAction(self.prefs_action)
 
+    def _ensure_chart_container(self):
+        """Builds the chart widget, its scrollbar and their container on first use."""
+        if self.chart_container is not None: return
+
+        self.chart_widget = CandleWidget()
+        self.chart_widget.set_mode(ChartMode.MARKER if self.marker_mode_action.isChecked() else ChartMode.CURSOR)
+        self.scrollbar = QScrollBar(Qt.Orientation.Horizontal)
+        self.chart_container = QWidget()
+        chart_layout = QVBoxLayout(self.chart_container)
+        chart_layout.setContentsMargins(0, 0, 0, 0)
+        chart_layout.setSpacing(0)
+        chart_layout.addWidget(self.chart_widget)
+        chart_layout.addWidget(self.scrollbar)
+        self.stack.addWidget(self.chart_container)
+
+        # --- Signal/Slot Connections ---
+        # These senders and receivers all live on the GUI thread, so the slots
+        # are invoked directly rather than letting Qt resolve thread affinity
+        # on every (frequent) emit.
+        direct = Qt.ConnectionType.DirectConnection
+        self.chart_widget.barHovered.connect(self.handle_bar_hover, direct)
+        self.chart_widget.viewChanged.connect(self.on_chart_view_changed, direct)
+        self.scrollbar.valueChanged.connect(self.on_scrollbar_moved, direct)
+        # Drop any hover still waiting to be applied once the mouse has left.
+        self.chart_widget.mouseLeftChart.connect(self._hover_timer.stop, direct)
+
+    @property
+    def info_widget(self) -> InfoWidget:
+        """The floating OHLCV info panel, created on first access."""
+        if self._info_widget is None:
+            self._info_widget = InfoWidget(self)
+            self.chart_widget.mouseLeftChart.connect(self._info_widget.hide, Qt.ConnectionType.DirectConnection)
+        return self._info_widget
+
     def on_scrollbar_moved(self, value: int):
         """Slot to handle scrollbar movements and update the chart's view."""
+        # Ignore the value changes caused by syncing the scrollbar to the chart.
+        if self._syncing_scrollbar: return
         self.chart_widget.set_start_bar(value)
+        # The scrollbar already shows this view, so record it; otherwise a later
+        # viewChanged landing on the previously cached view would be skipped.
+        state = self.chart_widget.state
+        self._last_view = (state.total_bars, state.visible_bars, state.start_bar)
 
     def on_chart_view_changed(self):
         """
@@ -165,29 +297,59 @@ class MainWindow(QMainWindow):
         This is called whenever the chart is panned or zoomed, ensuring the
         scrollbar accurately reflects the visible data range.
         """
-        self.scrollbar.blockSignals(True) # Prevent feedback loop
-        total_bars = len(self.chart_widget.state.df)
-        visible_bars = self.chart_widget.state.visible_bars
-        start_bar = self.chart_widget.state.start_bar
+        state = self.chart_widget.state
+        total_bars = state.total_bars
+        visible_bars = state.visible_bars
+        start_bar = state.start_bar
+
+        # Skip the update entirely if the view hasn't actually changed.
+        view = (total_bars, visible_bars, start_bar)
+        if view == self._last_view: return
+        self._last_view = view
         
+        self._syncing_scrollbar = True # Prevent feedback loop (see on_scrollbar_moved)
+        # Suspend repaints so the three setters below cause a single repaint.
+        self.scrollbar.setUpdatesEnabled(False)
         # The max scroll value is the total number of bars minus what's visible.
         max_scroll_val = max(0, total_bars - visible_bars)
         self.scrollbar.setRange(0, max_scroll_val)
         self.scrollbar.setPageStep(visible_bars) # How much to move when clicking the track
         self.scrollbar.setValue(start_bar)
-        
-        self.scrollbar.blockSignals(False)
+        self.scrollbar.setUpdatesEnabled(True)
+        self._syncing_scrollbar = False
 
-    def on_mode_change(self, action: QAction):
-        """Slot to update the chart's interaction mode."""
-        self.chart_widget.set_mode(action.data())
+    def _set_chart_mode(self, mode: ChartMode):
+        """Updates the chart's interaction mode."""
+        # Resolve the hover handling once per mode change rather than per hover.
+        self._hover_sink = self._queue_hover if mode == ChartMode.CURSOR else self._hide_info
+        self._hover_timer.stop()
+        self._pending_hover = None
+        # Before the first load there is no chart yet; it picks up the checked
+        # mode when it is created.
+        if self.chart_widget is not None:
+            self.chart_widget.set_mode(mode)
 
     def handle_bar_hover(self, data_row: pd.Series, mouse_pos: QPoint):
-        """Displays the info widget when hovering over a candle in cursor mode."""
-        if self.chart_widget.state.mode == ChartMode.CURSOR:
-            self.info_widget.update_and_show(data_row, mouse_pos + QPoint(15, 15))
-        else:
-            self.info_widget.hide()
+        """Routes a bar hover to the handler for the current chart mode."""
+        self._hover_sink(data_row, mouse_pos)
+
+    def _queue_hover(self, data_row: pd.Series, mouse_pos: QPoint):
+        """Cursor mode: queues the hovered bar for the info widget, applied at most once per frame."""
+        self._pending_hover = (data_row, mouse_pos)
+        if not self._hover_timer.isActive():
+            self._hover_timer.start()
+
+    def _hide_info(self, data_row: pd.Series, mouse_pos: QPoint):
+        """Other modes: keeps the info widget hidden."""
+        if self._info_widget is not None:
+            self._info_widget.hide()
+
+    def _flush_hover(self):
+        """Displays the info widget for the latest hovered candle."""
+        if self._pending_hover is None: return
+        data_row, mouse_pos = self._pending_hover
+        self._pending_hover = None
+        self.info_widget.update_and_show(data_row, mouse_pos + QPoint(15, 15))
 
     def update_action_states(self, is_data_loaded: bool):
         """Enables or disables toolbar actions based on whether data is loaded."""
@@ -195,73 +357,107 @@ class MainWindow(QMainWindow):
         self.prepopulate_action.setEnabled(is_data_loaded)
         self.train_action.setEnabled(is_data_loaded)
 
-    def format_timeframe(self, tf_str: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def format_timeframe(tf_str: str) -> str:
         """Utility to format a technical timeframe string into a human-readable one."""
-        match = re.match(r"(\d+)([a-zA-Z]+)", tf_str)
+        match = _TF_RE.match(tf_str)
         if not match: return tf_str 
         num_str, unit_str = match.groups()
         num = int(num_str)
-        unit_map = {'sec': 'Second', 'min': 'Minute', 'h': 'Hour', 'd': 'Day', 'w': 'Week', 'm': 'Month'}
-        unit_full = next((v for k, v in unit_map.items() if k in unit_str.lower()), unit_str.capitalize())
+        unit_lower = unit_str.lower()
+        unit_full = _UNIT_MAP.get(unit_lower)
+        if unit_full is None:
+            first = unit_lower[0]
+            if first == 'm':
+                unit_full = 'Minute' if unit_lower.startswith('min') else 'Month'
+            else:
+                unit_full = _UNIT_BY_LETTER.get(first, unit_str.capitalize())
         if num > 1: unit_full += "s"
         return f"{num} {unit_full}"
 
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _parse_display_text(stem: str) -> str:
+        """
+        Builds a descriptive chart title from a data file's name (without extension).
+
+        Files named like `TICKER_TIMEFRAME_OHLCV_YEAR_MONTH` produce a title such
+        as "AAPL (1 Hour)  -  October 2023". Other names (including ones with an
+        invalid year or month) fall back to a simpler title.
+        """
+        match = _STEM_RE.match(stem)
+        if not match:
+            return stem.replace('_', ' ').title()
+        ticker, timeframe, year, month_num = match.groups()
+        month_name = _MONTH_NAMES[int(month_num)]
+        return f"{ticker.upper()} ({MainWindow.format_timeframe(timeframe)})  -  {month_name} {year}"
+
     def open_file(self):
         """
         Opens a file dialog and initiates asynchronous data loading.
         """
-        last_dir = self.settings.value("last_data_dir", str(Path.home()))
+        last_dir = self._settings_value("last_data_dir", str(Path.home()))
         file_path, _ = QFileDialog.getOpenFileName(self, "Select a Parquet Data File", last_dir, "Parquet Files (*.parquet);;All Files (*)")
         
         if file_path:
             self.load_action.setEnabled(False) # Disable button during load
             self.statusBar().showMessage(f"Loading {Path(file_path).name}...")
+            QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
 
-            # --- Asynchronous Loading Setup ---
-            self.thread = QThread()
-            self.worker = DataLoaderWorker()
-            self.worker.moveToThread(self.thread)
-            # Connect worker signals to main thread slots
-            self.thread.started.connect(lambda: self.worker.run(file_path))
-            self.worker.finished.connect(self._on_data_loaded)
-            self.worker.error.connect(self._on_data_load_error)
-            # Clean up thread and worker after completion
-            self.worker.finished.connect(self.thread.quit)
-            self.worker.finished.connect(self.worker.deleteLater)
-            self.thread.finished.connect(self.thread.deleteLater)
-            # Start the event loop in the new thread
-            self.thread.start()
-
-    def _on_data_loaded(self, file_path: str, ohlc_data: pd.DataFrame):
+            # The load runs on the persistent I/O thread (see _setup_io_thread).
+            self._io_worker.load_requested.emit(file_path)
+
+    def _setup_io_thread(self):
+        """
+        Creates the data loader worker and the thread it runs on.
+
+        Both live for the lifetime of the window and are reused by every
+        load, so opening a file needs no thread setup or signal wiring.
+        """
+        self._io_thread = QThread(self)
+        self._io_worker = DataLoaderWorker()
+        self._io_worker.moveToThread(self._io_thread)
+        # Connect worker signals to main thread slots
+        self._io_worker.progress_started.connect(self._on_load_progress_started)
+        self._io_worker.progress.connect(self.progress_bar.setValue)
+        self._io_worker.finished.connect(self._on_data_loaded)
+        self._io_worker.error.connect(self._on_data_load_error)
+        self._io_thread.finished.connect(self._io_worker.deleteLater)
+        # Start the event loop in the I/O thread
+        self._io_thread.start()
+
+    def _on_load_progress_started(self, total_rows: int):
+        """Slot to show the progress bar, sized to the number of rows being loaded."""
+        # A maximum of 0 shows a busy indicator when the total is unknown.
+        self.progress_bar.setRange(0, total_rows)
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+
+    def _on_data_loaded(self, file_path: str, ohlc_data: pd.DataFrame, arrays: dict):
         """Slot to handle successfully loaded data."""
+        QApplication.restoreOverrideCursor()
+        self.progress_bar.hide()
         self.statusBar().showMessage(f"Successfully loaded {Path(file_path).name}", 5000)
         self.load_action.setEnabled(True)
-        self.settings.setValue("last_data_dir", str(Path(file_path).parent))
+        self._queue_settings_write("last_data_dir", str(Path(file_path).parent))
         
-        # Attempt to parse the filename to create a descriptive title.
-        display_text = ""
-        try:
-            stem = Path(file_path).stem
-            parts = stem.split('_')
-            if len(parts) >= 5:
-                ticker, timeframe, _, year, month_num = parts[0:5]
-                month_name = datetime.strptime(month_num, '%m').strftime('%B')
-                display_text = f"{ticker.upper()} ({self.format_timeframe(timeframe)})  -  {month_name} {year}"
-            else: 
-                display_text = stem.replace('_', ' ').title()
-        except Exception:
-            display_text = Path(file_path).stem.split('_')[0].upper()
+        # Parse the filename to create a descriptive title.
+        display_text = self._parse_display_text(Path(file_path).stem)
 
+        self._ensure_chart_container()
         self.chart_widget.set_symbol(display_text)
-        self.chart_widget.set_data(ohlc_data)
+        self.chart_widget.set_data(ohlc_data, arrays=arrays)
         # Switch from welcome screen to the chart widget.
-        self.setCentralWidget(self.chart_container)
+        self.stack.setCurrentWidget(self.chart_container)
         self.setWindowTitle(f'Candlestick Labelling Tool - {file_path}')
         self.update_action_states(is_data_loaded=True)
         self.on_chart_view_changed() # Initialize the scrollbar
 
     def _on_data_load_error(self, error_message: str):
         """Slot to handle data loading failures."""
+        QApplication.restoreOverrideCursor()
+        self.progress_bar.hide()
         self.statusBar().showMessage("Failed to load data.", 5000)
         self.load_action.setEnabled(True)
         QMessageBox.critical(self, "Loading Error", error_message)
@@ -269,21 +465,13 @@ class MainWindow(QMainWindow):
 
     def open_preferences_dialog(self):
         """
-        Opens the preferences dialog, ensuring only one instance can exist.
+        Shows the shared preferences dialog, bringing it to the front if it is
+        already open.
         """
-        if self.prefs_dialog is None:  # Create dialog if it doesn't exist
-            self.prefs_dialog = PreferencesDialog(self)
-            self.prefs_dialog.settings_applied.connect(self.on_settings_applied)
-            self.prefs_dialog.finished.connect(self.on_prefs_dialog_closed) # Cleanup
-            self.prefs_dialog.show()
-        else: # If it exists, just bring it to the front
-            self.prefs_dialog.activateWindow()
-            self.prefs_dialog.raise_()
-
-    def on_prefs_dialog_closed(self):
-        """Slot to clean up the dialog reference when it's closed."""
-        self.prefs_dialog = None
-        
+        self.prefs_dialog.show()
+        self.prefs_dialog.activateWindow()
+        self.prefs_dialog.raise_()
+
     def on_settings_applied(self):
         """
         Slot called when settings are applied in the preferences dialog.
@@ -291,30 +479,79 @@ class MainWindow(QMainWindow):
         This reloads the style settings in the chart state and triggers a full
         re-computation of the rendering buffers to reflect the changes.
         """
-        print("Applying new style settings...")
+        # The chart reads the current settings when it is created, so there is
+        # nothing to refresh before the first file has been loaded.
+        if self.chart_widget is None: return
+        logger.debug("Applying new style settings...")
         self.chart_widget.state.load_style_settings()
         self.chart_widget._update_all_buffers() # Force refresh with new settings
 
+    def _settings_value(self, key: str, default_value=None):
+        """Reads a setting, taking any not-yet-flushed write into account."""
+        if key in self._pending_settings:
+            return self._pending_settings[key]
+        return self.settings.value(key, default_value)
+
+    def _queue_settings_write(self, key: str, value):
+        """Stages a settings write and (re)starts the debounce timer."""
+        self._pending_settings[key] = value
+        self._settings_timer.start()
+
+    def _flush_settings(self):
+        """Writes all staged settings and syncs them to storage in one go."""
+        self._settings_timer.stop()
+        if not self._pending_settings: return
+        for key, value in self._pending_settings.items():
+            self.settings.setValue(key, value)
+        self._pending_settings.clear()
+        self.settings.sync()
+
     def closeEvent(self, event):
-        """Saves window geometry upon closing the application."""
-        self.settings.setValue("geometry", self.saveGeometry())
+        """Saves window geometry (if changed) and any pending settings upon closing the application."""
+        new_geom = self.saveGeometry()
+        # Only write the geometry when it differs from what is already stored, so
+        # closing without moving or resizing the window causes no settings sync.
+        if new_geom != self._initial_geom_bytes:
+            self._pending_settings["geometry"] = new_geom
+        self._flush_settings()
+        # Stop the I/O thread, letting any load in progress finish first.
+        self._io_thread.quit()
+        self._io_thread.wait()
+        # Then stop the worker process used for large files.
+        shutdown_executor()
         super().closeEvent(event)
 
+# The contents of 'main.qss', cached after the first read.
+_stylesheet = None
+
+def _apply_stylesheet(app: QApplication):
+    """Reads the application stylesheet (once) and applies it."""
+    global _stylesheet
+    if _stylesheet is None:
+        try:
+            with open('main.qss', 'r') as f: 
+                _stylesheet = f.read()
+        except FileNotFoundError: 
+            logger.warning("Stylesheet 'main.qss' not found. Using default styles.")
+            _stylesheet = ""
+    app.setStyleSheet(_stylesheet)
+
 def main():
     app = QApplication(sys.argv)
     # Set organization and app name for QSettings to work correctly.
     app.setOrganizationName("CandleCorp")
     app.setApplicationName("CandlestickLabellingTool")
-    
-    try:
-        with open('main.qss', 'r') as f: 
-            app.setStyleSheet(f.read())
-    except FileNotFoundError: 
-        print("Stylesheet 'main.qss' not found. Using default styles.")
+    # Decode all icon images up front into the pixmap cache. The handful of
+    # toolbar icons fits comfortably within Qt's default cache limit.
+    for path in _ICON_FILES:
+        _cached_pixmap(path)
         
     window = MainWindow()
-    window.setWindowIcon(QIcon('icons/appicon.png'))
+    window.setWindowIcon(_file_icon('icons/appicon.png'))
     window.show()
+    # Read and apply the stylesheet once the event loop is running, so the
+    # window can be mapped without waiting on disk I/O.
+    QTimer.singleShot(0, lambda: _apply_stylesheet(app))
     sys.exit(app.exec())
 
 if __name__ == '__main__':
@@ -1,11 +1,15 @@
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QPushButton, QColorDialog, 
-                             QDialogButtonBox, QLabel, QGridLayout, 
+                             QDialogButtonBox, QLabel, QGridLayout, QFormLayout, 
                              QDoubleSpinBox, QTabWidget, QWidget, QComboBox, 
-                             QSpinBox, QGroupBox, QRadioButton)
-from PyQt6.QtGui import QColor, QPalette
-from PyQt6.QtCore import pyqtSignal
+                             QSpinBox, QGroupBox, QRadioButton, QStyle, 
+                             QStyleOptionFocusRect)
+from PyQt6.QtGui import QColor, QPainter, QPalette
+from PyQt6.QtCore import pyqtSignal, QTimer
 
-from style_manager import StyleManager, PEN_STYLE_MAP
+import style_manager
+from style_manager import PEN_STYLE_MAP, color_from_hex
+
+_HEXARGB = QColor.NameFormat.HexArgb
 
 class ColorButton(QPushButton):
     """
@@ -15,41 +19,84 @@ class ColorButton(QPushButton):
     color. It emits a `colorChanged` signal when the color is updated.
     """
     colorChanged = pyqtSignal(QColor)
+    # One color picker shared by every ColorButton (see _shared_color_dialog).
+    _shared_dialog: QColorDialog | None = None
 
     def __init__(self, initial_color: QColor, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._color = initial_color
+        # The color as a #AARRGGBB string, kept in step with _color.
+        self._hex_argb = initial_color.name(_HEXARGB)
         self.setFixedSize(100, 28)
         self.setFlat(True)
-        self.setAutoFillBackground(True)
-        self._update_swatch()
         self.clicked.connect(self._choose_color)
 
-    def _update_swatch(self):
-        """Updates the button's background color to match the stored color."""
-        palette = self.palette()
-        palette.setColor(QPalette.ColorRole.Button, self._color)
-        self.setPalette(palette)
+    def paintEvent(self, event):
+        """
+        Paints the button as a swatch of its color with a 1 px frame.
+
+        While pressed, the swatch is inset by a further pixel and framed in the
+        palette's Dark color; with keyboard focus, the style's focus rectangle
+        is drawn around it.
+        """
+        painter = QPainter(self)
+        if not self.isEnabled(): painter.setOpacity(0.4)
+        pressed = self.isDown()
+        inset = 3 if pressed else 2
+        swatch = self.rect().adjusted(inset, inset, -inset, -inset)
+        painter.fillRect(swatch, self._color)
+        frame_role = QPalette.ColorRole.Dark if pressed else QPalette.ColorRole.Mid
+        painter.setPen(self.palette().color(frame_role))
+        painter.drawRect(swatch.adjusted(0, 0, -1, -1))
+        if self.hasFocus():
+            option = QStyleOptionFocusRect()
+            option.initFrom(self)
+            option.rect = self.rect().adjusted(1, 1, -1, -1)
+            self.style().drawPrimitive(QStyle.PrimitiveElement.PE_FrameFocusRect, option, painter, self)
 
     def _choose_color(self):
         """Opens a color dialog and updates the button's color if one is selected."""
-        dialog = QColorDialog(self._color, self)
-        # Enable the alpha channel in the color picker.
-        dialog.setOption(QColorDialog.ColorDialogOption.ShowAlphaChannel, True)
+        dialog = self._shared_color_dialog()
+        # Parent it to this button's window (the preferences dialog, which
+        # outlives the buttons) so it stays on top of it.
+        window = self.window()
+        if dialog.parent() is not window:
+            dialog.setParent(window, dialog.windowFlags())
+        dialog.setCurrentColor(self._color)
         if dialog.exec():
             new_color = dialog.selectedColor()
             if new_color.isValid():
                 self.setColor(new_color)
 
+    @classmethod
+    def _shared_color_dialog(cls) -> QColorDialog:
+        """
+        Returns the color picker shared by all buttons, creating it if needed.
+
+        The PreferencesDialog calls this while idle after it is first shown, so
+        the picker already exists by the first click. Qt's own (non-native) dialog is used, which is
+        quicker to create and open than the platform dialog.
+        """
+        if cls._shared_dialog is None:
+            dialog = cls._shared_dialog = QColorDialog()
+            # Enable the alpha channel in the color picker.
+            dialog.setOptions(QColorDialog.ColorDialogOption.ShowAlphaChannel | QColorDialog.ColorDialogOption.DontUseNativeDialog)
+        return cls._shared_dialog
+
     def color(self) -> QColor:
         """Returns the current QColor of the button."""
         return self._color
+
+    def hex_argb(self) -> str:
+        """Returns the current color as a #AARRGGBB string."""
+        return self._hex_argb
     
     def setColor(self, color: QColor):
         """Sets a new QColor for the button and emits the colorChanged signal."""
         if self._color != color:
             self._color = color
-            self._update_swatch()
+            self._hex_argb = color.name(_HEXARGB)
+            self.update()
             self.colorChanged.emit(self._color)
 
 class PreferencesDialog(QDialog):
@@ -61,23 +108,79 @@ class PreferencesDialog(QDialog):
     settings. It emits `settings_applied` when the user confirms changes.
     """
     settings_applied = pyqtSignal()
+
+    # The 'Colors' tab rows: (label, settings key, button attribute).
+    _COLOR_ROWS = (
+        ("Up Candle Body", "colors/up_candle", "up_candle_btn"),
+        ("Down Candle Body", "colors/down_candle", "down_candle_btn"),
+        ("Up Candle Wick", "colors/up_wick", "up_wick_btn"),
+        ("Down Candle Wick", "colors/down_wick", "down_wick_btn"),
+        ("Up Volume Bar", "colors/up_volume", "up_volume_btn"),
+        ("Down Volume Bar", "colors/down_volume", "down_volume_btn"),
+    )
+    # The 'Lines' tab rows: (label, color key, width key, style key, attribute
+    # prefix for the <prefix>_color_btn/_width_spin/_style_combo controls).
+    _LINE_ROWS = (
+        ("Crosshair", "lines/crosshair", "props/crosshair_width", "props/crosshair_style", "crosshair"),
+        ("Price Grid", "lines/price_grid", "props/price_grid_width", "props/price_grid_style", "price_grid"),
+        ("Time Grid", "lines/time_grid", "props/time_grid_width", "props/time_grid_style", "time_grid"),
+    )
     
+    # How each kind of control in _controls is set from a stored value. For
+    # "radio", the widget is a dict mapping each value to its radio button.
+    _CONTROL_SETTERS = {
+        "color": lambda w, v: w.setColor(color_from_hex(v)),
+        "spin": lambda w, v: w.setValue(int(v)),
+        "dspin": lambda w, v: w.setValue(float(v)),
+        "combo": lambda w, v: w.setCurrentText(v),
+        "radio": lambda w, v: v in w and w[v].setChecked(True),
+    }
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Preferences")
         self.setMinimumWidth(450)
-        self.sm = StyleManager()
+        # The shared StyleManager caches every value it has read, so controls
+        # can look their settings up individually.
+        self.sm = style_manager.INSTANCE
+
+        # Build the whole widget tree with painting and the dialog's signals
+        # suspended, then lay it out once at the end.
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
 
         main_layout = QVBoxLayout(self)
         
-        # Use a QTabWidget to organize settings into logical groups.
-        tab_widget = QTabWidget()
-        main_layout.addWidget(tab_widget)
+        # Use a QTabWidget to organize settings into logical groups. Each tab
+        # starts as an empty page and its controls are only built the first
+        # time it is shown (see _ensure_tab_built).
+        self.tab_widget = QTabWidget()
+        main_layout.addWidget(self.tab_widget)
 
-        tab_widget.addTab(self._create_colors_tab(), "Colors")
-        tab_widget.addTab(self._create_lines_tab(), "Lines")
-        tab_widget.addTab(self._create_background_tab(), "Background")
-        tab_widget.addTab(self._create_other_tab(), "Other")
+        # Per tab: (title, builder).
+        self._tabs = [
+            ("Colors", self._create_colors_tab),
+            ("Lines", self._create_lines_tab),
+            ("Background", self._create_background_tab),
+            ("Other", self._create_other_tab),
+        ]
+        # Indices of the tabs whose controls have been built.
+        self._built = set()
+        # (settings key, getter for the control's current value) for every
+        # built control; the builders register their controls here.
+        self._bindings = []
+        # (settings key, widget, kind) for every built control, used to refresh
+        # the controls in place; kind selects the setter in _CONTROL_SETTERS.
+        self._controls = []
+        # Set by Restore Defaults so the next Apply notifies the chart even
+        # though the controls then match the stored settings.
+        self._defaults_restored = False
+        for title, *_ in self._tabs:
+            page = QWidget()
+            QVBoxLayout(page).setContentsMargins(0, 0, 0, 0)
+            self.tab_widget.addTab(page, title)
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
+        self._ensure_tab_built(self.tab_widget.currentIndex())
 
         # Standard dialog buttons (OK, Cancel, Apply) plus a custom "Restore Defaults".
         button_box = QDialogButtonBox()
@@ -93,50 +196,63 @@ class PreferencesDialog(QDialog):
         
         main_layout.addWidget(button_box)
 
+        self.blockSignals(False)
+        self.setUpdatesEnabled(True)
+        self.updateGeometry()
+
+    def _ensure_tab_built(self, index: int):
+        """Builds the controls of the tab at `index` the first time it is shown."""
+        if index < 0 or index in self._built: return
+        self._built.add(index)
+        # The dialog may already be visible here, so hold off repainting the
+        # page until all of the tab's controls are in place.
+        page = self.tab_widget.widget(index)
+        page.setUpdatesEnabled(False)
+        page.layout().addWidget(self._tabs[index][1]())
+        page.setUpdatesEnabled(True)
+
     def _create_colors_tab(self) -> QWidget:
         """Creates the 'Colors' tab with controls for all chart element colors."""
         tab = QWidget()
-        layout = QGridLayout(tab)
+        layout = QFormLayout(tab)
         
         # Candle and Volume Colors
-        layout.addWidget(QLabel("Up Candle Body:"), 0, 0); self.up_candle_btn = ColorButton(QColor(self.sm.get_value("colors/up_candle"))); layout.addWidget(self.up_candle_btn, 0, 1)
-        layout.addWidget(QLabel("Down Candle Body:"), 1, 0); self.down_candle_btn = ColorButton(QColor(self.sm.get_value("colors/down_candle"))); layout.addWidget(self.down_candle_btn, 1, 1)
-        layout.addWidget(QLabel("Up Candle Wick:"), 2, 0); self.up_wick_btn = ColorButton(QColor(self.sm.get_value("colors/up_wick"))); layout.addWidget(self.up_wick_btn, 2, 1)
-        layout.addWidget(QLabel("Down Candle Wick:"), 3, 0); self.down_wick_btn = ColorButton(QColor(self.sm.get_value("colors/down_wick"))); layout.addWidget(self.down_wick_btn, 3, 1)
-        layout.addWidget(QLabel("Up Volume Bar:"), 4, 0); self.up_volume_btn = ColorButton(QColor(self.sm.get_value("colors/up_volume"))); layout.addWidget(self.up_volume_btn, 4, 1)
-        layout.addWidget(QLabel("Down Volume Bar:"), 5, 0); self.down_volume_btn = ColorButton(QColor(self.sm.get_value("colors/down_volume"))); layout.addWidget(self.down_volume_btn, 5, 1)
-
-        layout.setRowStretch(6, 1) # Add spacer at the bottom
+        for label, key, attr in self._COLOR_ROWS:
+            btn = ColorButton(color_from_hex(self.sm.get(key)))
+            setattr(self, attr, btn)
+            self._bindings.append((key, btn.hex_argb))
+            self._controls.append((key, btn, "color"))
+            layout.addRow(f"{label}:", btn)
         return tab
 
     def _create_lines_tab(self) -> QWidget:
         """Creates the 'Lines' tab for configuring grid lines and the crosshair."""
         tab = QWidget()
-        layout = QGridLayout(tab)
+        tab_layout = QVBoxLayout(tab)
+        layout = QGridLayout()
         
         layout.addWidget(QLabel("<b>Color</b>"), 0, 1)
         layout.addWidget(QLabel("<b>Width</b>"), 0, 2)
         layout.addWidget(QLabel("<b>Style</b>"), 0, 3)
 
-        # Crosshair settings
-        layout.addWidget(QLabel("Crosshair:"), 1, 0)
-        self.crosshair_color_btn = ColorButton(QColor(self.sm.get_value("lines/crosshair"))); layout.addWidget(self.crosshair_color_btn, 1, 1)
-        self.crosshair_width_spin = QSpinBox(); self.crosshair_width_spin.setRange(1, 10); self.crosshair_width_spin.setValue(int(self.sm.get_value("props/crosshair_width"))); layout.addWidget(self.crosshair_width_spin, 1, 2)
-        self.crosshair_style_combo = QComboBox(); self.crosshair_style_combo.addItems(PEN_STYLE_MAP.keys()); self.crosshair_style_combo.setCurrentText(self.sm.get_value("props/crosshair_style")); layout.addWidget(self.crosshair_style_combo, 1, 3)
-
-        # Price Grid settings
-        layout.addWidget(QLabel("Price Grid:"), 2, 0)
-        self.price_grid_color_btn = ColorButton(QColor(self.sm.get_value("lines/price_grid"))); layout.addWidget(self.price_grid_color_btn, 2, 1)
-        self.price_grid_width_spin = QSpinBox(); self.price_grid_width_spin.setRange(1, 10); self.price_grid_width_spin.setValue(int(self.sm.get_value("props/price_grid_width"))); layout.addWidget(self.price_grid_width_spin, 2, 2)
-        self.price_grid_style_combo = QComboBox(); self.price_grid_style_combo.addItems(PEN_STYLE_MAP.keys()); self.price_grid_style_combo.setCurrentText(self.sm.get_value("props/price_grid_style")); layout.addWidget(self.price_grid_style_combo, 2, 3)
-
-        # Time Grid settings
-        layout.addWidget(QLabel("Time Grid:"), 3, 0)
-        self.time_grid_color_btn = ColorButton(QColor(self.sm.get_value("lines/time_grid"))); layout.addWidget(self.time_grid_color_btn, 3, 1)
-        self.time_grid_width_spin = QSpinBox(); self.time_grid_width_spin.setRange(1, 10); self.time_grid_width_spin.setValue(int(self.sm.get_value("props/time_grid_width"))); layout.addWidget(self.time_grid_width_spin, 3, 2)
-        self.time_grid_style_combo = QComboBox(); self.time_grid_style_combo.addItems(PEN_STYLE_MAP.keys()); self.time_grid_style_combo.setCurrentText(self.sm.get_value("props/time_grid_style")); layout.addWidget(self.time_grid_style_combo, 3, 3)
+        # One row of color, width and style controls per line.
+        style_names = list(PEN_STYLE_MAP)
+        for row, (label, color_key, width_key, style_key, prefix) in enumerate(self._LINE_ROWS, start=1):
+            color_btn = ColorButton(color_from_hex(self.sm.get(color_key)))
+            width_spin = QSpinBox(); width_spin.setRange(1, 10); width_spin.setValue(int(self.sm.get(width_key)))
+            style_combo = QComboBox(); style_combo.addItems(style_names); style_combo.setCurrentText(self.sm.get(style_key))
+            setattr(self, f"{prefix}_color_btn", color_btn)
+            setattr(self, f"{prefix}_width_spin", width_spin)
+            setattr(self, f"{prefix}_style_combo", style_combo)
+            self._bindings += [(color_key, color_btn.hex_argb), (width_key, width_spin.value), (style_key, style_combo.currentText)]
+            self._controls += [(color_key, color_btn, "color"), (width_key, width_spin, "spin"), (style_key, style_combo, "combo")]
+            layout.addWidget(QLabel(f"{label}:"), row, 0)
+            layout.addWidget(color_btn, row, 1); layout.addWidget(width_spin, row, 2); layout.addWidget(style_combo, row, 3)
+        # Keep the controls packed to the left; any spare width goes to an empty last column.
+        layout.setColumnStretch(4, 1)
         
-        layout.setRowStretch(4, 1) # Add spacer at the bottom
+        tab_layout.addLayout(layout)
+        tab_layout.addStretch() # Add spacer at the bottom
         return tab
 
     def _create_background_tab(self) -> QWidget:
@@ -148,19 +264,32 @@ class PreferencesDialog(QDialog):
         group_layout = QGridLayout(group_box)
 
         self.solid_radio = QRadioButton("Solid Color"); group_layout.addWidget(self.solid_radio, 0, 0)
-        self.bg_color1_btn = ColorButton(QColor(self.sm.get_value("background/color1"))); group_layout.addWidget(self.bg_color1_btn, 0, 1)
+        self.bg_color1_btn = ColorButton(color_from_hex(self.sm.get("background/color1"))); group_layout.addWidget(self.bg_color1_btn, 0, 1)
         
         self.gradient_radio = QRadioButton("Gradient"); group_layout.addWidget(self.gradient_radio, 1, 0)
-        self.bg_color2_btn = ColorButton(QColor(self.sm.get_value("background/color2"))); group_layout.addWidget(self.bg_color2_btn, 1, 1)
+        self.bg_color2_btn = ColorButton(color_from_hex(self.sm.get("background/color2"))); group_layout.addWidget(self.bg_color2_btn, 1, 1)
         
-        self.gradient_dir_combo = QComboBox(); self.gradient_dir_combo.addItems(["Vertical", "Horizontal"]); self.gradient_dir_combo.setCurrentText(self.sm.get_value("background/gradient_direction")); group_layout.addWidget(self.gradient_dir_combo, 1, 2)
+        self.gradient_dir_combo = QComboBox(); self.gradient_dir_combo.addItems(["Vertical", "Horizontal"]); self.gradient_dir_combo.setCurrentText(self.sm.get("background/gradient_direction")); group_layout.addWidget(self.gradient_dir_combo, 1, 2)
         
         self.solid_radio.toggled.connect(self._update_bg_controls)
         
         # Set initial state based on saved settings
-        bg_mode = self.sm.get_value("background/mode")
+        bg_mode = self.sm.get("background/mode")
         if bg_mode == "Solid": self.solid_radio.setChecked(True)
         else: self.gradient_radio.setChecked(True)
+
+        self._bindings += [
+            ("background/mode", lambda: "Solid" if self.solid_radio.isChecked() else "Gradient"),
+            ("background/color1", self.bg_color1_btn.hex_argb),
+            ("background/color2", self.bg_color2_btn.hex_argb),
+            ("background/gradient_direction", self.gradient_dir_combo.currentText),
+        ]
+        self._controls += [
+            ("background/mode", {"Solid": self.solid_radio, "Gradient": self.gradient_radio}, "radio"),
+            ("background/color1", self.bg_color1_btn, "color"),
+            ("background/color2", self.bg_color2_btn, "color"),
+            ("background/gradient_direction", self.gradient_dir_combo, "combo"),
+        ]
         
         layout.addWidget(group_box)
         layout.addStretch()
@@ -174,43 +303,54 @@ class PreferencesDialog(QDialog):
     def _create_other_tab(self) -> QWidget:
         """Creates the 'Other' tab for miscellaneous settings."""
         tab = QWidget()
-        layout = QGridLayout(tab)
-        layout.addWidget(QLabel("Volume Pane Ratio:"), 0, 0)
-        self.volume_ratio_spinner = QDoubleSpinBox(); self.volume_ratio_spinner.setRange(0.1, 0.9); self.volume_ratio_spinner.setSingleStep(0.05); self.volume_ratio_spinner.setValue(float(self.sm.get_value("other/volume_pane_ratio"))); layout.addWidget(self.volume_ratio_spinner, 0, 1)
-        
-        layout.setRowStretch(1, 1)
-        layout.setColumnStretch(2, 1)
+        layout = QFormLayout(tab)
+        # Keep the spin box at its natural width rather than filling the row.
+        layout.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.FieldsStayAtSizeHint)
+        self.volume_ratio_spinner = QDoubleSpinBox(); self.volume_ratio_spinner.setRange(0.1, 0.9); self.volume_ratio_spinner.setSingleStep(0.05); self.volume_ratio_spinner.setValue(float(self.sm.get("other/volume_pane_ratio"))); layout.addRow("Volume Pane Ratio:", self.volume_ratio_spinner)
+        self._bindings.append(("other/volume_pane_ratio", self.volume_ratio_spinner.value))
+        self._controls.append(("other/volume_pane_ratio", self.volume_ratio_spinner, "dspin"))
         return tab
 
+    def _reload_from_settings(self):
+        """Updates every built control to reflect the currently stored settings."""
+        setters = self._CONTROL_SETTERS
+        for key, widget, kind in self._controls:
+            setters[kind](widget, self.sm.get(key))
+
+    def showEvent(self, event):
+        """
+        Refreshes the controls whenever the dialog is opened.
+
+        The dialog instance is reused between openings, so any edits that were
+        discarded with Cancel must be replaced by the stored values.
+
+        The first opening also schedules creation of the shared color picker
+        for when the event loop is next idle, so it is ready by the first
+        swatch click without being built for users who never open Preferences.
+        """
+        if not event.spontaneous():
+            self._reload_from_settings()
+            if ColorButton._shared_dialog is None:
+                QTimer.singleShot(0, ColorButton._shared_color_dialog)
+        super().showEvent(event)
+
     def _apply_and_save_settings(self):
-        """Saves all current UI control values to persistent settings and emits a signal."""
-        # --- Colors ---
-        self.sm.set_value("colors/up_candle", self.up_candle_btn.color().name(QColor.NameFormat.HexArgb))
-        self.sm.set_value("colors/down_candle", self.down_candle_btn.color().name(QColor.NameFormat.HexArgb))
-        self.sm.set_value("colors/up_wick", self.up_wick_btn.color().name(QColor.NameFormat.HexArgb))
-        self.sm.set_value("colors/down_wick", self.down_wick_btn.color().name(QColor.NameFormat.HexArgb))
-        self.sm.set_value("colors/up_volume", self.up_volume_btn.color().name(QColor.NameFormat.HexArgb))
-        self.sm.set_value("colors/down_volume", self.down_volume_btn.color().name(QColor.NameFormat.HexArgb))
-        
-        # --- Lines ---
-        self.sm.set_value("lines/crosshair", self.crosshair_color_btn.color().name(QColor.NameFormat.HexArgb))
-        self.sm.set_value("props/crosshair_width", self.crosshair_width_spin.value())
-        self.sm.set_value("props/crosshair_style", self.crosshair_style_combo.currentText())
-        self.sm.set_value("lines/price_grid", self.price_grid_color_btn.color().name(QColor.NameFormat.HexArgb))
-        self.sm.set_value("props/price_grid_width", self.price_grid_width_spin.value())
-        self.sm.set_value("props/price_grid_style", self.price_grid_style_combo.currentText())
-        self.sm.set_value("lines/time_grid", self.time_grid_color_btn.color().name(QColor.NameFormat.HexArgb))
-        self.sm.set_value("props/time_grid_width", self.time_grid_width_spin.value())
-        self.sm.set_value("props/time_grid_style", self.time_grid_style_combo.currentText())
-        
-        # --- Background ---
-        self.sm.set_value("background/mode", "Solid" if self.solid_radio.isChecked() else "Gradient")
-        self.sm.set_value("background/color1", self.bg_color1_btn.color().name(QColor.NameFormat.HexArgb))
-        self.sm.set_value("background/color2", self.bg_color2_btn.color().name(QColor.NameFormat.HexArgb))
-        self.sm.set_value("background/gradient_direction", self.gradient_dir_combo.currentText())
-        
-        # --- Other ---
-        self.sm.set_value("other/volume_pane_ratio", self.volume_ratio_spinner.value())
+        """Saves the control values that differ from the stored settings and emits a signal."""
+        # Only built controls have bindings; tabs that were never opened cannot
+        # have been edited. Values are compared as strings, since QSettings
+        # reads numbers back from disk as strings.
+        updates = {}
+        for key, getter in self._bindings:
+            value = getter()
+            if str(self.sm.get(key)) != str(value):
+                updates[key] = value
+        if updates:
+            with self.sm.batch():
+                for key, value in updates.items():
+                    self.sm.set_value(key, value)
+        elif not self._defaults_restored:
+            return
+        self._defaults_restored = False
         
         # Notify the main window that settings have changed and should be reloaded.
         self.settings_applied.emit()
@@ -223,8 +363,7 @@ class PreferencesDialog(QDialog):
     def restore_defaults(self):
         """Restores all settings to their default values."""
         self.sm.restore_defaults()
-        # This is a simple way to refresh the dialog's UI with the new default values.
-        # It closes the current dialog and asks the parent to open a fresh one.
-        # A more complex implementation might update all UI controls in-place.
-        self.parent().open_preferences_dialog()
-        self.close()
\ No newline at end of file
+        self._defaults_restored = True
+        color_from_hex.cache_clear()
+        # Refresh the existing controls in place with the new default values.
+        self._reload_from_settings()
\ No newline at end of file
@@ -1,24 +1,31 @@
+from contextlib import contextmanager
+from types import MappingProxyType
+from functools import lru_cache
 from PyQt6.QtGui import QColor
 from PyQt6.QtCore import QSettings, Qt
 
+__all__ = ["StyleManager", "INSTANCE", "PEN_STYLE_MAP", "DEFAULT_STYLE_SETTINGS", "color_from_hex"]
+
 # This dictionary defines the application's default appearance. It serves as
 # the "single source of truth" for all style settings. If a setting is not
 # found in QSettings, the application will fall back to the value defined here.
-# Colors are stored as strings to be compatible with QSettings.
-DEFAULT_STYLE_SETTINGS = {
+# Colors are stored as #AARRGGBB literals, the format the preferences dialog
+# writes, to be compatible with QSettings. The mapping is read-only, since it
+# is shared by every module that imports it.
+DEFAULT_STYLE_SETTINGS = MappingProxyType({
     # Candle & Volume Colors
-    "colors/up_candle": QColor(0, 204, 0).name(QColor.NameFormat.HexRgb),
-    "colors/down_candle": QColor(204, 0, 0).name(QColor.NameFormat.HexRgb),
-    "colors/up_wick": QColor(180, 180, 180).name(QColor.NameFormat.HexRgb),
-    "colors/down_wick": QColor(180, 180, 180).name(QColor.NameFormat.HexRgb),
+    "colors/up_candle": "#ff00cc00",
+    "colors/down_candle": "#ffcc0000",
+    "colors/up_wick": "#ffb4b4b4",
+    "colors/down_wick": "#ffb4b4b4",
     # Volume colors include an alpha component for semi-transparency.
-    "colors/up_volume": QColor(0, 204, 0, 180).name(QColor.NameFormat.HexArgb),
-    "colors/down_volume": QColor(204, 0, 0, 180).name(QColor.NameFormat.HexArgb),
+    "colors/up_volume": "#b400cc00",
+    "colors/down_volume": "#b4cc0000",
     
     # Line Colors (Gridlines, Crosshair)
-    "lines/crosshair": QColor(220, 220, 220, 150).name(QColor.NameFormat.HexArgb),
-    "lines/price_grid": QColor(80, 80, 80).name(QColor.NameFormat.HexRgb),
-    "lines/time_grid": QColor(80, 80, 80).name(QColor.NameFormat.HexRgb),
+    "lines/crosshair": "#96dcdcdc",
+    "lines/price_grid": "#ff505050",
+    "lines/time_grid": "#ff505050",
     
     # Line Properties (Width and Style)
     "props/crosshair_width": 1,
@@ -30,13 +37,16 @@ DEFAULT_STYLE_SETTINGS = {
 
     # Chart Background
     "background/mode": "Solid", # Can be "Solid" or "Gradient"
-    "background/color1": QColor(25, 25, 25).name(QColor.NameFormat.HexRgb),
-    "background/color2": QColor(55, 55, 55).name(QColor.NameFormat.HexRgb), # Used for gradient
+    "background/color1": "#ff191919",
+    "background/color2": "#ff373737", # Used for gradient
     "background/gradient_direction": "Vertical", # Can be "Vertical" or "Horizontal"
     
     # Other Layout Properties
     "other/volume_pane_ratio": 0.25, # The height of the volume pane as a ratio of chart area
-}
+})
+
+# The top-level QSettings groups holding the style settings.
+_STYLE_GROUPS = tuple(dict.fromkeys(key.split("/", 1)[0] for key in DEFAULT_STYLE_SETTINGS))
 
 # Maps human-readable style names (used in settings) to their Qt.PenStyle enum values.
 PEN_STYLE_MAP = {
@@ -45,8 +55,15 @@ PEN_STYLE_MAP = {
     "DotLine": Qt.PenStyle.DotLine,
     "DashDotLine": Qt.PenStyle.DashDotLine,
 }
-# A reverse map, which is not used in this project but is good practice to have.
-REVERSE_PEN_STYLE_MAP = {v: k for k, v in PEN_STYLE_MAP.items()}
+
+@lru_cache(maxsize=256)
+def color_from_hex(hex_str: str) -> QColor:
+    """
+    Returns a QColor for a hex color string, parsing each distinct string once.
+
+    The returned QColor is shared between callers and must not be modified.
+    """
+    return QColor(hex_str)
 
 class StyleManager:
     """
@@ -56,11 +73,51 @@ class StyleManager:
     convenient way to get and set style properties while ensuring that
     a default value is always available. This decouples the rest of the
     application from the specifics of settings persistence.
+
+    Values are cached in memory once read or written, so repeated lookups do
+    not go back to the settings backend. The application shares one instance,
+    `INSTANCE`, so that every reader sees the same cache.
     """
     def __init__(self):
-        # QSettings automatically handles storing data in a platform-appropriate
-        # location (e.g., Windows Registry, macOS .plist, Linux .ini).
-        self.settings = QSettings()
+        self._settings = None
+        # Maps each key to its current value, filled on first read or write.
+        self._cache = {}
+
+    @property
+    def settings(self) -> QSettings:
+        """
+        The underlying QSettings, created on first use.
+
+        QSettings automatically handles storing data in a platform-appropriate
+        location (e.g., Windows Registry, macOS .plist, Linux .ini). It is
+        created lazily so that the shared instance can exist before the
+        application has set its organization and application names.
+        """
+        if self._settings is None:
+            self._settings = QSettings()
+        return self._settings
+
+    def get(self, key: str):
+        """
+        Returns the current value of a style setting.
+
+        This is the fast path for the style keys defined in
+        `DEFAULT_STYLE_SETTINGS`: after the first read it is a single dict lookup.
+
+        Args:
+            key: The key for the setting (e.g., "colors/up_candle").
+
+        Returns:
+            The stored value for the key, or its default if not stored.
+
+        Raises:
+            KeyError: If `key` is not a known style setting.
+        """
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = self.settings.value(key, DEFAULT_STYLE_SETTINGS[key])
+            return value
 
     def get_value(self, key: str, default_value=None):
         """
@@ -76,9 +133,12 @@ class StyleManager:
         Returns:
             The stored value for the key, or the default value if not found.
         """
-        if default_value is None:
-            default_value = DEFAULT_STYLE_SETTINGS.get(key)
-        return self.settings.value(key, default_value)
+        if default_value is not None:
+            # A caller-specific default must not be cached for other callers.
+            return self.settings.value(key, default_value)
+        if key in DEFAULT_STYLE_SETTINGS:
+            return self.get(key)
+        return self.settings.value(key)
 
     def set_value(self, key: str, value):
         """
@@ -88,8 +148,27 @@ class StyleManager:
             key: The key for the setting.
             value: The value to be saved.
         """
+        self._cache[key] = value
         self.settings.setValue(key, value)
         
+    @contextmanager
+    def batch(self):
+        """
+        Groups several `set_value` calls and writes them to storage together.
+
+        Usage:
+            with style_manager.batch():
+                style_manager.set_value(...)
+                ...
+
+        The values are synced once, explicitly, when the block exits, rather
+        than whenever QSettings' deferred update happens to run.
+        """
+        try:
+            yield self
+        finally:
+            self.settings.sync()
+
     def restore_defaults(self):
         """
         Removes all custom style settings from QSettings.
@@ -99,5 +178,13 @@ class StyleManager:
         requests them.
         """
         print("Restoring default style settings by removing custom values...")
-        for key in DEFAULT_STYLE_SETTINGS.keys():
-            self.settings.remove(key)
\ No newline at end of file
+        self._cache.clear()
+        # Every style key lives in one of a few groups ("colors/...", etc.), so
+        # clear each group in one operation and write the result once.
+        settings = self.settings
+        for group in _STYLE_GROUPS:
+            settings.beginGroup(group); settings.remove(""); settings.endGroup()
+        settings.sync()
+
+# The StyleManager shared by the whole application.
+INSTANCE = StyleManager()
@@ -2,13 +2,24 @@ from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame
 from PyQt6.QtGui import QIcon, QPixmap
 from PyQt6.QtCore import Qt, QSize
 
+# The welcome icon, rendered from the icon theme on first use and then shared
+# (QPixmap is implicitly shared, so every label reuses the same image).
+_WELCOME_PIXMAP: QPixmap | None = None
+
+def _get_welcome_pixmap() -> QPixmap:
+    """Returns the 128x128 welcome icon, looking it up in the theme only once."""
+    global _WELCOME_PIXMAP
+    if _WELCOME_PIXMAP is None:
+        # Using a standard theme icon ensures it's likely available on any system.
+        _WELCOME_PIXMAP = QIcon.fromTheme("document-open").pixmap(QSize(128, 128))
+    return _WELCOME_PIXMAP
+
 class WelcomeWidget(QWidget):
     """
     A placeholder widget displayed on application startup.
 
     It prompts the user to load a data file and provides a visually appealing
     entry point before the main chart is shown. The components of this widget
-
     are given object names to allow for detailed styling via QSS.
     """
     def __init__(self, parent=None):
@@ -23,10 +34,7 @@ class WelcomeWidget(QWidget):
         # --- Icon ---
         # A large, friendly icon to visually anchor the widget.
         icon_label = QLabel()
-        # Using a standard theme icon ensures it's likely available on any system.
-        icon = QIcon.fromTheme("document-open") 
-        pixmap = icon.pixmap(QSize(128, 128))
-        icon_label.setPixmap(pixmap)
+        icon_label.setPixmap(_get_welcome_pixmap())
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         
         # --- Main Text ---
@@ -55,6 +63,6 @@ class WelcomeWidget(QWidget):
         container.setLayout(layout)
         
         # The final layout for the WelcomeWidget itself contains just the container.
+        # (Passing `self` installs it as the widget's layout.)
         main_layout = QVBoxLayout(self)
         main_layout.addWidget(container)
-        self.setLayout(main_layout)
\ No newline at end of file